@@ -1,19 +1,20 @@
+import asyncio
 import time
 
-from comando.helpers.itach import iTach
+from comando.helpers.itach import ITach
 
-dev = iTach("10.0.30.61")
+dev = ITach("10.0.30.61")
 
 # It seems either the Flex or (most likely) the SC-LX71 is very particular/erratic about responding to commands sent via TCP. For example, ?P does not seem to work when the device is in standby.
 
 # power status
-print(dev.send("?P"))
+print(asyncio.run(dev.send("?P")))
 
 # power off
-# print(dev.send("PF"))
+# print(asyncio.run(dev.send("PF")))
 
 # power on
-# print(dev.send(["PO"] * 3))
+# print(asyncio.run(dev.send(["PO"] * 3)))
 
 
 # s.send(b"PF\r")
@@ -16,9 +16,6 @@ def main() -> None:
     # Load environment variables
     load_dotenv("dev.env" if args.reload else None)
 
-    # Setup logging
-    # setup_logging(args.debug)
-
     # Run app
     uvicorn.run(
         "comando.api.server:create_app",
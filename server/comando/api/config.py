@@ -4,8 +4,20 @@ from importlib import resources
 
 import tomllib
 
+from comando.device.playback.appletv import AppleTV
+from comando.device.playback.wiim import WiiM
+from comando.device.processor.minidsp import MiniDSP
+from comando.device.switch.vertex import Vertex2
+
 logger = logging.getLogger(__name__)
 
+_DEVICE_MAP = {
+    "appletv": AppleTV,
+    "vertex2": Vertex2,
+    "wiim": WiiM,
+    "minidsp": MiniDSP,
+}
+
 
 def get_devices() -> None:
     # Read configuration
@@ -18,28 +30,18 @@ def get_devices() -> None:
         return
 
     # Create devices
-    from comando.device.playback.appletv import AppleTV
-    from comando.device.playback.wiim import WiiM
-    from comando.device.processor.minidsp import MiniDSP
-    from comando.device.switch.vertex import Vertex2
-
-    device_map = {
-        "appletv": AppleTV,
-        "vertex2": Vertex2,
-        "wiim": WiiM,
-        "minidsp": MiniDSP,
-    }
     devices = []
     for device_config in config["devices"]:
         if "identifier" not in device_config:
             logger.warning("Skipped device with missing identifier")
             continue
-        if device_config["identifier"] not in device_map:
+        cls = _DEVICE_MAP.get(device_config["identifier"])
+        if cls is None:
             logger.warning(
                 f"Unsupported device identifier: {device_config["identifier"]}"
             )
             continue
-        devices.append(device_map[device_config["identifier"]](**device_config))
+        devices.append(cls(**device_config))
 
     return devices
 
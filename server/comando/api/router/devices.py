@@ -1,6 +1,7 @@
-from typing import Any
+import asyncio
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from comando.controller import Controller
 
@@ -13,23 +14,25 @@ async def list_devices() -> list[str]:
     return Controller.get_instance().list_devices()
 
 
-@router.get("/{device_name}/sensors")
-async def get_device_sensors(device_name: str) -> dict[str, Any]:
+@router.get("/{device_name}/sensors", response_class=ORJSONResponse)
+async def get_device_sensors(device_name: str) -> ORJSONResponse:
     """Get all sensor values for a specific device"""
     try:
         device = Controller.get_instance().get_device(device_name)
 
-        # Get all sensor properties (decorated with @sensor)
-        sensor_values = {}
-        for attr_name in device.sensors:
-            if attr_name.startswith("_"):
-                continue
-            try:
-                sensor_values[attr_name] = await getattr(device, attr_name)
-            except Exception as e:
-                sensor_values[attr_name] = str(e)
-
-        return sensor_values
+        # Read all sensor properties (decorated with @sensor) concurrently
+        names = device._public_sensors
+        results = await asyncio.gather(
+            *(getattr(device, name) for name in names), return_exceptions=True
+        )
+
+        # Sensor values have a dynamic shape, so skip response model validation
+        return ORJSONResponse(
+            {
+                name: str(result) if isinstance(result, Exception) else result
+                for name, result in zip(names, results, strict=True)
+            }
+        )
     except KeyError as e:
         raise HTTPException(
             status_code=404, detail=f"Device '{device_name}' not found"
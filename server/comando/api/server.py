@@ -1,14 +1,17 @@
+import atexit
 import logging
 import os
+import queue
 
 from contextlib import _AsyncGeneratorContextManager, asynccontextmanager
 from importlib import resources
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Any, Callable
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 import comando
 
@@ -16,6 +19,23 @@ from comando.controller import Controller
 
 from .config import devices
 from .router import router
+from .static import CachedStatic
+
+_PKG_ROOT = resources.files(comando)
+_LOG_PATH = _PKG_ROOT / "comando.log"
+_STATIC_PATH = str(_PKG_ROOT / "static")
+
+_WILDCARD_CORS_HEADERS = (
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"*"),
+    (b"access-control-allow-headers", b"*"),
+)
+
+_NO_CACHE_HEADERS = [
+    (b"cache-control", b"no-cache, no-store, must-revalidate"),
+    (b"pragma", b"no-cache"),
+    (b"expires", b"0"),
+]
 
 
 def setup_logging() -> None:
@@ -38,7 +58,7 @@ def setup_logging() -> None:
 
     # Setup file handler
     file_handler = RotatingFileHandler(
-        filename=resources.files(comando) / "comando.log",
+        filename=_LOG_PATH,
         encoding="utf-8",
         mode="a",
         maxBytes=1024 * 1024,  # 1 MB
@@ -52,16 +72,99 @@ def setup_logging() -> None:
     console_handler.setLevel(console_level)
     console_handler.setFormatter(formatter)
 
-    # Remove any existing handlers and add new ones
+    # Log via a queue so formatting and I/O happen on a background thread and
+    # not on the event loop
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Remove any existing handlers and add the queue handler
     root_logger.handlers.clear()
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
 
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 
+class WildcardCORSMiddleware:
+    """
+    Lightweight ASGI middleware that allows all origins, methods and headers.
+    Preflight requests are answered directly without reaching the router.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": list(_WILDCARD_CORS_HEADERS),
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", []).extend(_WILDCARD_CORS_HEADERS)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class NoCacheMiddleware:
+    """ASGI middleware that adds headers to disable caching of all HTTP responses."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = (
+                    list(message.get("headers", ())) + _NO_CACHE_HEADERS
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _register_all(controller: Controller, devices: list) -> None:
+    """Register the configured devices, skipping any that are already registered."""
+    if controller._devices_registered:
+        return
+
+    registered = set(controller.list_devices())
+    for device in devices:
+        if device.identifier in registered:
+            continue
+        logger.debug(
+            "Registering device: %s (%s)",
+            device.identifier,
+            device.__class__.__name__,
+        )
+        controller.register_device(device)
+
+    controller._devices_registered = True
+
+
 def lifespan_factory() -> Callable[[FastAPI], _AsyncGeneratorContextManager[Any]]:
     """Factory to create a lifespan async context manager for Comando."""
 
@@ -70,11 +173,7 @@ def lifespan_factory() -> Callable[[FastAPI], _AsyncGeneratorContextManager[Any]
         logger.info("Initializing Comando controller and devices")
         controller = Controller.get_instance()
 
-        for device in devices:
-            logger.debug(
-                f"Registering device: {device.identifier} ({device.__class__.__name__})"
-            )
-            controller.register_device(device)
+        _register_all(controller, devices)
 
         logger.info("Starting controller")
         await controller.start()
@@ -98,28 +197,31 @@ def create_app() -> FastAPI:
     app = FastAPI(title="Comando", lifespan=lifespan)
 
     # CORS middleware configuration
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if os.getenv("COMANDO_DEV_CORS_WILDCARD", "").lower() in ("1", "true", "yes"):
+        app.add_middleware(WildcardCORSMiddleware)
+    else:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
     # Add middleware to disable caching
-    @app.middleware("http")
-    async def add_cache_control_header(request, call_next):
-        response = await call_next(request)
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        return response
+    app.add_middleware(NoCacheMiddleware)
+
+    # Only pure ASGI middleware is allowed; BaseHTTPMiddleware (which is what
+    # @app.middleware("http") uses) adds significant per-request overhead
+    assert not any(
+        isinstance(m.cls, type) and issubclass(m.cls, BaseHTTPMiddleware)
+        for m in app.user_middleware
+    ), "Use pure ASGI middleware instead of BaseHTTPMiddleware"
 
     app.include_router(router)
 
     # Serve the comando app as static files
-    static_path = resources.files(comando) / "static"
-    app.mount("/", StaticFiles(directory=str(static_path), html=True), name="comando")
+    app.mount("/", CachedStatic(directory=_STATIC_PATH, html=True), name="comando")
 
     logger.info("FastAPI application setup complete")
     return app
@@ -0,0 +1,115 @@
+import hashlib
+import logging
+import mimetypes
+import mmap
+import os
+
+from email.utils import formatdate
+from pathlib import Path
+
+from fastapi.staticfiles import StaticFiles
+from starlette.types import Receive, Scope, Send
+
+# Files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD: int = 256 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class CachedStatic:
+    """
+    ASGI app that serves static files preloaded into memory, with precomputed
+    ETag and Last-Modified headers. Requests that cannot be answered from memory
+    (unknown paths, range requests, non-GET/HEAD methods) are passed on to
+    StaticFiles.
+    """
+
+    def __init__(self, directory: str, html: bool = False):
+        self.directory = Path(directory)
+        self.html = html
+        self.fallback = StaticFiles(directory=directory, html=html)
+        self._files: dict[
+            str, tuple[bytes | mmap.mmap, list[tuple[bytes, bytes]], bytes]
+        ] = {}
+        self._preload()
+
+    def _preload(self) -> None:
+        """Read all files in the static directory and precompute their headers."""
+        for p in self.directory.rglob("*"):
+            if not p.is_file():
+                continue
+
+            if p.stat().st_size > MMAP_THRESHOLD:
+                fd = os.open(p, os.O_RDONLY)
+                try:
+                    data = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                finally:
+                    os.close(fd)
+            else:
+                data = p.read_bytes()
+            media_type = mimetypes.guess_type(p.name)[0] or "text/plain"
+            if media_type.startswith("text/"):
+                media_type += "; charset=utf-8"
+            etag = f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'.encode()
+            last_modified = formatdate(p.stat().st_mtime, usegmt=True).encode()
+
+            headers = [
+                (b"content-type", media_type.encode("latin-1")),
+                (b"content-length", str(len(data)).encode()),
+                (b"etag", etag),
+                (b"last-modified", last_modified),
+            ]
+            self._files[p.relative_to(self.directory).as_posix()] = (
+                data,
+                headers,
+                etag,
+            )
+
+        logger.info("Preloaded %d static files", len(self._files))
+
+    def _lookup(self, scope: Scope) -> tuple | None:
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+
+        rel = path.lstrip("/")
+        if self.html and (not rel or rel.endswith("/")):
+            rel += "index.html"
+        return self._files.get(rel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        entry = None
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            request_headers = dict(scope["headers"])
+            if b"range" not in request_headers:
+                entry = self._lookup(scope)
+
+        if entry is None:
+            await self.fallback(scope, receive, send)
+            return
+
+        data, headers, etag = entry
+        if_none_match = request_headers.get(b"if-none-match")
+        if if_none_match and etag in (t.strip() for t in if_none_match.split(b",")):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(b"etag", etag)],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": list(headers)}
+        )
+        if scope["method"] == "HEAD":
+            body = b""
+        elif isinstance(data, mmap.mmap):
+            # ASGI servers expect bytes; copy straight from the page cache
+            body = data[:]
+        else:
+            body = data
+        await send({"type": "http.response.body", "body": body})
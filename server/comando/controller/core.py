@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
 import logging
+import threading
 import time
 
 from functools import wraps
@@ -12,11 +14,15 @@ from typing import (
     Callable,
     Optional,
     Protocol,
-    runtime_checkable,
 )
 
+EVENT_QUEUE_SIZE: int = 1024
+
 logger = logging.getLogger(__name__)
 
+# Instance attributes added to device classes by the @device decorator
+_DEVICE_SLOTS = ("_controller", "_polling_tasks", "_sensor_cache")
+
 
 class Controller:
     """
@@ -25,41 +31,130 @@ class Controller:
     """
 
     _instance = None
+    _instance_lock = threading.Lock()
 
     @classmethod
     def get_instance(cls) -> Controller:
         if cls._instance is None:
-            cls._instance = cls()
+            # Double-checked locking so concurrent callers share one instance
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
     def __init__(self):
-        self.devices: set[DeviceProtocol] = set()
-        self.event_subscribers: dict[str, set[Callable[[Any], Awaitable[None]]]] = {}
+        self.devices: dict[str, DeviceProtocol] = {}
+        self.event_subscribers: dict[
+            tuple[str, str], set[Callable[[Any], Awaitable[None]]]
+        ] = {}
         self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.dropped_events = 0
+        self._devices_registered = False
+        # Created in start() so it is bound to the loop running the dispatcher,
+        # the controller outlives any single event loop
+        self._event_queue: Optional[asyncio.Queue[tuple[DeviceProtocol, str, Any]]] = (
+            None
+        )
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        # Detached handle_event tasks, referenced until done
+        self._dispatch_tasks: set[asyncio.Task] = set()
 
     async def start(self):
         """Initialize the controller and set up the event loop."""
-        logger.info("Connecting devices")
         self.event_loop = asyncio.get_running_loop()
-        for device in self.devices:
-            try:
-                await device.connect()
-            except Exception as e:
-                logger.warning(f"Failed to connect device {device.identifier}: {e}")
+        if self._dispatcher_task is None:
+            self._event_queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+            self._dispatcher_task = asyncio.create_task(self._dispatch_loop())
+
+        logger.info("Connecting devices")
+        await asyncio.gather(
+            *(self._safe_connect(device) for device in self.devices.values())
+        )
         logger.info("Controller started")
 
     async def stop(self):
         """Cleanup and stop all devices."""
-        for device in self.devices:
-            try:
-                await device.disconnect()
-            except Exception as e:
-                logger.error(f"Error disconnecting device {device.identifier}: {e}")
+        await asyncio.gather(
+            *(self._safe_disconnect(device) for device in self.devices.values())
+        )
+
+        if self._dispatcher_task is not None:
+            self._dispatcher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dispatcher_task
+            self._dispatcher_task = None
+        for task in self._dispatch_tasks:
+            task.cancel()
+        await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+        self._dispatch_tasks.clear()
+        self._event_queue = None
 
         self.devices.clear()
+        self._devices_registered = False
         self.event_subscribers.clear()
         logger.info("Controller stopped")
 
+    async def _safe_connect(self, device: DeviceProtocol) -> None:
+        try:
+            await device.connect()
+        except Exception as e:
+            logger.warning(f"Failed to connect device {device.identifier}: {e}")
+
+    async def _safe_disconnect(self, device: DeviceProtocol) -> None:
+        try:
+            await device.disconnect()
+        except Exception as e:
+            logger.error(f"Error disconnecting device {device.identifier}: {e}")
+
+    async def _dispatch_loop(self) -> None:
+        """Background task dispatching queued events to subscribers."""
+        while True:
+            device, event_name, value = await self._event_queue.get()
+            self._event_queue.task_done()
+            if (device.identifier, event_name) not in self.event_subscribers:
+                logger.debug(
+                    "Event raised: %s.%s = %s", device.identifier, event_name, value
+                )
+                continue
+
+            # Handle each event in its own task so a slow subscriber only delays
+            # its own event, not the events queued after it
+            task = asyncio.create_task(self.handle_event(device, event_name, value))
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(self._dispatch_done)
+
+    def _dispatch_done(self, task: asyncio.Task) -> None:
+        self._dispatch_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error dispatching event: {task.exception()}")
+
+    def queue_event(self, device: DeviceProtocol, event_name: str, value: Any) -> None:
+        """
+        Queue an event for dispatch to subscribers by the background dispatcher.
+        Events are dropped (and counted in dropped_events) if the queue is full
+        or the controller has not been started.
+
+        Args:
+            device: Device that raised the event
+            event_name: Name of the event
+            value: Event value/data
+        """
+        if self._event_queue is None:
+            self.dropped_events += 1
+            logger.debug(
+                "Controller not started, dropped event %s.%s",
+                device.identifier,
+                event_name,
+            )
+            return
+        try:
+            self._event_queue.put_nowait((device, event_name, value))
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            logger.warning(
+                "Event queue full, dropped event %s.%s", device.identifier, event_name
+            )
+
     def register_device(self, device: DeviceProtocol) -> None:
         """
         Register a device with the controller.
@@ -68,9 +163,9 @@ class Controller:
             device: Instance of a class decorated with @device that implements DeviceProtocol
         """
 
-        if not isinstance(device, DeviceProtocol) or not hasattr(
-            device, "_device_config"
-        ):
+        # The @device decorator sets _device_config, which serves as the marker
+        # for classes implementing DeviceProtocol
+        if not hasattr(device, "_device_config") or not hasattr(device, "identifier"):
             raise TypeError(
                 f"Device {device.__class__.__name__} does not adhere to DeviceProtocol and/or does not use @device decorator"
             )
@@ -81,12 +176,12 @@ class Controller:
                 f"Device name '{device.name}' contains invalid characters. Use only alphanumeric and underscores."
             )
 
-        if device in self.devices:
+        if device.identifier in self.devices:
             raise ValueError(
                 f"Device with identifier '{device.identifier}' already registered"
             )
 
-        self.devices.add(device)
+        self.devices[device.identifier] = device
         logger.info(
             f"Registered device: {device.identifier} ({device.__class__.__name__})"
         )
@@ -104,16 +199,14 @@ class Controller:
         Returns:
             The device instance
         """
-        for device in self.devices:
-            if device.identifier != identifier:
-                continue
-            if device_type and not isinstance(device, device_type):
-                raise TypeError(
-                    f"Device '{identifier}' is not of type {device_type.__name__}"
-                )
-            return device
-
-        raise KeyError(f"No device registered with identifier '{identifier}'")
+        device = self.devices.get(identifier)
+        if device is None:
+            raise KeyError(f"No device registered with identifier '{identifier}'")
+        if device_type and not isinstance(device, device_type):
+            raise TypeError(
+                f"Device '{identifier}' is not of type {device_type.__name__}"
+            )
+        return device
 
     def subscribe(self, device_name: str, event_name: str, callback: callable) -> None:
         """
@@ -127,10 +220,8 @@ class Controller:
         if not inspect.iscoroutinefunction(callback):
             raise ValueError("Callback must be an async function")
 
-        key = f"{device_name}.{event_name}"
-        if key not in self.event_subscribers:
-            self.event_subscribers[key] = set()
-        self.event_subscribers[key].add(callback)
+        key = (device_name, event_name)
+        self.event_subscribers.setdefault(key, set()).add(callback)
 
     def unsubscribe(
         self, device_name: str, event_name: str, callback: callable
@@ -143,11 +234,12 @@ class Controller:
             event_name: Name of the event
             callback: Callback function to unsubscribe
         """
-        key = f"{device_name}.{event_name}"
-        if key in self.event_subscribers:
-            self.event_subscribers[key].discard(callback)
-            if not self.event_subscribers[key]:
-                del self.event_subscribers[key]
+        key = (device_name, event_name)
+        subscribers = self.event_subscribers.get(key)
+        if subscribers is not None:
+            subscribers.discard(callback)
+            if not subscribers:
+                self.event_subscribers.pop(key, None)
 
     async def handle_event(
         self, device: DeviceProtocol, event_name: str, value: Any
@@ -161,28 +253,40 @@ class Controller:
             value: Event value/data
         """
 
-        key = f"{device.identifier}.{event_name}"
-        logger.debug(f"Event raised: {key} = {value}")
-        subscribers = self.event_subscribers.get(key, set())
+        logger.debug("Event raised: %s.%s = %s", device.identifier, event_name, value)
+        # Snapshot subscribers so callbacks may subscribe/unsubscribe while the
+        # event is being dispatched
+        subscribers = tuple(
+            self.event_subscribers.get((device.identifier, event_name), ())
+        )
+        if not subscribers:
+            return
 
-        for callback in subscribers:
-            try:
-                await callback(value)
-            except Exception as e:
-                logger.error(f"Error in event callback for {key}: {e}")
+        # Run subscribers concurrently so a slow callback does not delay others
+        results = await asyncio.gather(
+            *(callback(value) for callback in subscribers), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Error in event callback for {device.identifier}.{event_name}: {result}"
+                )
 
-    def list_devices(self) -> list[DeviceProtocol]:
-        """Return a list of all registered devices."""
-        return [device.identifier for device in self.devices]
+    def list_devices(self) -> list[str]:
+        """Return a list of the identifiers of all registered devices."""
+        return list(self.devices)
 
-    def list_subscriptions(self) -> dict[str, set[callable]]:
-        """Return a dictionary of all event subscriptions."""
+    def list_subscriptions(self) -> dict[tuple[str, str], set[callable]]:
+        """Return a dictionary of all event subscriptions keyed by (device, event)."""
         return dict(self.event_subscribers)
 
 
-@runtime_checkable
 class DeviceProtocol(Protocol):
-    """Protocol defining the required interface for devices"""
+    """
+    Protocol defining the required interface for devices. Devices are identified
+    by the _device_config attribute set by the @device decorator rather than by
+    runtime isinstance checks.
+    """
 
     identifier: str
 
@@ -210,8 +314,38 @@ def device(
         # Store all configuration in a single dictionary
         nonlocal ttl, timeout  # Add this line to access outer scope variables
 
+        # Classes using __slots__ (e.g. @dataclass(slots=True)) have no instance
+        # __dict__, so add slots for the attributes injected below via a subclass
+        if not cls.__dictoffset__:
+            cls = type(
+                cls.__name__,
+                (cls,),
+                {
+                    "__slots__": _DEVICE_SLOTS,
+                    "__module__": cls.__module__,
+                    "__qualname__": cls.__qualname__,
+                    "__doc__": cls.__doc__,
+                },
+            )
+
         config = {"ttl": ttl, "timeout": timeout, **kwargs}
         cls._device_config = config
+        # Resolved device-wide defaults, invariant for the lifetime of the class
+        cls._effective_ttl = ttl
+        cls._effective_timeout = timeout
+
+        def raise_event_sync(self, event_name: str, value: any) -> None:
+            """
+            Raises an event with the given name and value without awaiting.
+            This method is automatically added by the @device decorator.
+
+            Args:
+                event_name (str): Name of the event to raise
+                value (any): Value associated with the event
+            """
+            if self._controller is None:
+                self._controller = Controller.get_instance()
+            self._controller.queue_event(self, event_name, value)
 
         async def raise_event(self, event_name: str, value: any) -> None:
             """
@@ -222,35 +356,57 @@ def device(
                 event_name (str): Name of the event to raise
                 value (any): Value associated with the event
             """
-            controller = Controller.get_instance()
-            await controller.handle_event(self, event_name, value)
+            self.raise_event_sync(event_name, value)
 
         def __hash__(self):
             return hash(self.identifier)
 
         @property
         def sensors(self) -> list[str]:
-            return [
-                attr_name
-                for attr_name, attr in inspect.getmembers(self.__class__)
-                if type(attr).__name__ == "SensorProperty"
-            ]
+            return [attr_name for attr_name, _ in self.__class__._sensor_properties]
 
         @property
         def timeout(self) -> int:
-            return self._device_config.get("timeout")
+            return cls._effective_timeout
 
         cls.raise_event = raise_event
+        cls.raise_event_sync = raise_event_sync
         cls.__hash__ = __hash__
         cls.sensors = sensors
         cls.timeout = timeout
 
+        # Collect sensor properties once, the sensor set is fixed per class
+        sensor_properties = {}
+        for klass in reversed(cls.__mro__):
+            for attr_name, attr in vars(klass).items():
+                if type(attr).__name__ == "SensorProperty":
+                    sensor_properties[attr_name] = attr
+                else:
+                    sensor_properties.pop(attr_name, None)
+        cls._sensor_properties = tuple(sorted(sensor_properties.items()))
+        for _, attr in cls._sensor_properties:
+            attr._resolve_defaults(cls)
+        cls._polling_sensors = tuple(
+            (attr_name, attr)
+            for attr_name, attr in cls._sensor_properties
+            if attr.poll_interval is not None
+        )
+
+        # Sensor names exposed via the API
+        cls._public_sensors = tuple(
+            attr_name
+            for attr_name, _ in cls._sensor_properties
+            if not attr_name.startswith("_")
+        )
+
         # Add _polling_tasks initialization to __init__
         original_init = cls.__init__
 
         def __init__(self, *args, **kwargs):
             original_init(self, *args, **kwargs)
             self._polling_tasks: dict[str, asyncio.Task] = {}
+            self._sensor_cache: dict[str, tuple[Any, int]] = {}
+            self._controller: Optional[Controller] = None
 
         cls.__init__ = __init__
 
@@ -258,18 +414,15 @@ def device(
         original_connect = cls.connect
 
         async def connect(self) -> None:
+            self._controller = Controller.get_instance()
             await original_connect(self)
             self._polling_tasks = {}
 
             # Start polling tasks for all sensor properties that have poll_interval
-            for attr_name, attr in inspect.getmembers(self.__class__):
-                if (
-                    type(attr).__name__ == "SensorProperty"
-                    and attr.poll_interval is not None
-                ):
-                    task = asyncio.create_task(attr._polling_loop(self))
-                    logger.debug(f"Created polling loop for {attr_name}")
-                    self._polling_tasks[attr_name] = task
+            for attr_name, attr in self.__class__._polling_sensors:
+                task = asyncio.create_task(attr._polling_loop(self))
+                logger.debug("Created polling loop for %s", attr_name)
+                self._polling_tasks[attr_name] = task
 
         cls.connect = connect
 
@@ -286,6 +439,7 @@ def device(
             except Exception:
                 pass
             self._polling_tasks.clear()
+            self._sensor_cache.clear()
             await original_disconnect(self)
 
         cls.disconnect = disconnect
@@ -317,103 +471,147 @@ def sensor(
     """
 
     def decorator(func: Callable) -> Callable:
-        cache = {}
+        inflight: dict[tuple[int, str], asyncio.Future] = {}
 
         class SensorProperty:
             def __init__(self, fget, fset=None):
                 self.fget = fget
                 self.fset = fset
+                self._fget_is_async = inspect.iscoroutinefunction(fget)
                 self.poll_interval = (
                     poll_interval  # Store poll_interval as instance variable
                 )
+                # Effective TTL (in integer nanoseconds, for comparing with
+                # time.monotonic_ns()) and timeout per device class. A sensor can
+                # be inherited by several device classes with different defaults,
+                # these are filled in by the @device decorator.
+                self._effective: dict[type, tuple[Optional[int], Optional[float]]] = {}
                 wraps(fget)(self)
 
+            def _resolve_defaults(self, device_cls: type) -> None:
+                """Use device-wide defaults for TTL and timeout if not set."""
+                effective_ttl = device_cls._effective_ttl if ttl is None else ttl
+                self._effective[device_cls] = (
+                    None if effective_ttl is None else int(effective_ttl * 1e9),
+                    device_cls._effective_timeout if timeout is None else timeout,
+                )
+
+            def _effective_for(
+                self, obj_cls: type
+            ) -> tuple[Optional[int], Optional[float]]:
+                """Return the effective TTL (ns) and timeout for a device class."""
+                effective = self._effective.get(obj_cls)
+                if effective is None:
+                    # Undecorated subclass (or no @device at all), use the nearest
+                    # decorated base class and remember the result
+                    effective = next(
+                        (
+                            self._effective[klass]
+                            for klass in obj_cls.__mro__
+                            if klass in self._effective
+                        ),
+                        (None if ttl is None else int(ttl * 1e9), timeout),
+                    )
+                    self._effective[obj_cls] = effective
+                return effective
+
             async def _polling_loop(self, obj):
                 """Background polling loop for the sensor."""
+                # Schedule polls against a monotonic deadline so the period does
+                # not drift by the time each read takes
+                next_at = time.monotonic()
                 while True:
                     try:
                         await self.__get__(obj)  # Poll the sensor
-                        await asyncio.sleep(poll_interval)
+                        next_at += poll_interval
+                        now = time.monotonic()
+                        if next_at <= now:
+                            # Fallen behind, skip missed polls instead of piling up
+                            missed = (now - next_at) // poll_interval + 1
+                            next_at += missed * poll_interval
+                        await asyncio.sleep(next_at - now)
                     except asyncio.CancelledError:
                         break
                     except Exception as e:
                         logger.error(f"Error polling sensor {func.__name__}: {e}")
                         await asyncio.sleep(1)  # Brief delay on error
+                        next_at = time.monotonic()
 
             def __get__(self, obj, objtype=None):
                 if obj is None:
                     return self
 
                 async def async_get():
-                    # Use obj.__class__ instead of objtype
-                    if not hasattr(obj.__class__, "_device_config"):
-                        raise TypeError(
-                            f"Class '{obj.__class__.__name__}' using @sensor decorator must be decorated with @device"
-                        )
+                    effective_ttl_ns, effective_timeout = self._effective_for(type(obj))
 
-                    # Get effective TTL and timeout (property values or device defaults)
-                    effective_ttl = ttl
-                    effective_timeout = timeout
-                    if hasattr(obj.__class__, "_device_config"):
-                        if effective_ttl is None:
-                            effective_ttl = obj.__class__._device_config.get("ttl")
-                        if effective_timeout is None:
-                            effective_timeout = obj.__class__._device_config.get(
-                                "timeout"
-                            )
-
-                    instance_key = (id(obj), func.__name__)
-                    current_time = time.monotonic()
+                    cache = obj._sensor_cache
+                    cache_key = func.__name__
+                    instance_key = (id(obj), cache_key)
+                    current_time = time.monotonic_ns()
 
                     async def get_sensor_value():
-                        if inspect.iscoroutinefunction(self.fget):
+                        if self._fget_is_async:
                             return await self.fget(obj)
                         return self.fget(obj)
 
+                    async def fetch_sensor_value():
+                        # Get fresh value with timeout if specified
+                        if effective_timeout is not None:
+                            return await asyncio.wait_for(
+                                get_sensor_value(), timeout=effective_timeout
+                            )
+                        return await get_sensor_value()
+
+                    def fetch_done(fut: asyncio.Future) -> None:
+                        inflight.pop(instance_key, None)
+                        if not fut.cancelled():
+                            fut.exception()  # Mark exception as retrieved
+
                     def should_use_cache():
-                        if effective_ttl is None:
+                        if effective_ttl_ns is None:
                             return False
-                        if instance_key not in cache:
+                        if cache_key not in cache:
                             return False
-                        last_value, last_time = cache[instance_key]
-                        return (current_time - last_time) < effective_ttl
+                        _, last_time = cache[cache_key]
+                        return (current_time - last_time) < effective_ttl_ns
 
-                    logger.debug(f"Reading {func.__name__} sensor")
+                    logger.debug("Reading %s sensor", func.__name__)
 
                     try:
                         # Use cached value if available and not expired
                         if should_use_cache():
-                            value = cache[instance_key][0]
+                            value = cache[cache_key][0]
                             logger.debug(
-                                f"Using cached value for {func.__name__}: {value}"
+                                "Using cached value for %s: %s", func.__name__, value
                             )
                             return value
 
-                        # Get fresh value with timeout if specified
-                        if effective_timeout is not None:
-                            current_value = await asyncio.wait_for(
-                                get_sensor_value(), timeout=effective_timeout
-                            )
-                        else:
-                            current_value = await get_sensor_value()
+                        # Get fresh value, sharing a read already in progress so
+                        # concurrent readers only trigger a single fetch
+                        fetch = inflight.get(instance_key)
+                        if fetch is None:
+                            fetch = asyncio.ensure_future(fetch_sensor_value())
+                            inflight[instance_key] = fetch
+                            fetch.add_done_callback(fetch_done)
+                        current_value = await asyncio.shield(fetch)
 
                         # Log the resolved value
-                        logger.debug(f"Read value for {func.__name__}: {current_value}")
+                        logger.debug(
+                            "Read value for %s: %s", func.__name__, current_value
+                        )
 
                         # Always update the cache timestamp when we get a fresh value
                         if (
-                            instance_key not in cache
-                            or cache[instance_key][0] != current_value
+                            cache_key not in cache
+                            or cache[cache_key][0] != current_value
                         ):
                             # Value changed or is new - raise event
-                            cache[instance_key] = (current_value, current_time)
+                            cache[cache_key] = (current_value, current_time)
                             event_name = f"{func.__name__}_changed"
-                            asyncio.create_task(
-                                obj.raise_event(event_name, current_value)
-                            )
+                            obj.raise_event_sync(event_name, current_value)
                         else:
                             # Value hasn't changed, but update timestamp
-                            cache[instance_key] = (current_value, current_time)
+                            cache[cache_key] = (current_value, current_time)
 
                         return current_value
 
@@ -428,9 +626,7 @@ def sensor(
                 if self.fset is None:
                     raise AttributeError("can't set attribute")
                 self.fset(obj, value)
-                instance_key = (id(obj), func.__name__)
-                if instance_key in cache:
-                    del cache[instance_key]
+                obj._sensor_cache.pop(func.__name__, None)
 
             def setter(self, fset):
                 return type(self)(self.fget, fset)
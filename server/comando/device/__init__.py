@@ -16,6 +16,15 @@ class Feature(Flag):
     AUDIO = auto()
 
 
+# Integer masks for checking features without Flag overhead, e.g. as
+# int(device.features) & PLAYBACK_MASK
+PLAYBACK_MASK: int = Feature.PLAYBACK.value
+SWITCH_MASK: int = Feature.SWITCH.value
+TV_MASK: int = Feature.TV.value
+PROCESSOR_MASK: int = Feature.PROCESSOR.value
+AUDIO_MASK: int = Feature.AUDIO.value
+
+
 class Sensor(Protocol):
     @property
     def name(self) -> str:
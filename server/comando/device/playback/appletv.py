@@ -2,16 +2,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 
 import pyatv
 
 from comando.controller import device, sensor
 
+PLAYSTATUS_TTL: float = 0.5
+
 logger = logging.getLogger(__name__)
 
+# String representations of pyatv enum values, cached per enum type
+_MEDIA_TYPE_STR: dict[Any, str] = {}
+_DEVICE_STATE_STR: dict[Any, str] = {}
+_REPEAT_STR: dict[Any, str] = {}
+_SHUFFLE_STR: dict[Any, str] = {}
+
+
+def _enum_str(cache: dict[Any, str], value: Any) -> str:
+    """Return str(value), caching the result in the given dictionary."""
+    s = cache.get(value)
+    if s is None:
+        s = cache[value] = str(value)
+    return s
+
 
 class DeviceListener(pyatv.interface.DeviceListener, pyatv.interface.PushListener):
     """Handles connection state changes for an Apple TV device."""
@@ -26,7 +43,7 @@ class DeviceListener(pyatv.interface.DeviceListener, pyatv.interface.PushListene
 
     def connection_closed(self) -> None:
         """Called when connection is closed normally."""
-        logger.debug(f"Connection closed to {self.device.identifier}")
+        logger.debug("Connection closed to %s", self.device.identifier)
         self._handle_disconnect()
 
     def _handle_disconnect(self) -> None:
@@ -36,19 +53,17 @@ class DeviceListener(pyatv.interface.DeviceListener, pyatv.interface.PushListene
 
     def playstatus_update(self, updater, playstatus: pyatv.interface.Playing) -> None:
         """Called when play status is updated."""
-        asyncio.create_task(
-            self.device.raise_event(
-                "playstatus_changed", "; ".join(str(playstatus).strip().split("\n"))
-            )
+        self.device.raise_event_sync(
+            "playstatus_changed", "; ".join(str(playstatus).strip().split("\n"))
         )
 
     def playstatus_error(self, updater, exception: Exception) -> None:
         """Called when there is an error getting play status."""
-        logger.debug(f"Play status error for {self.device.identifier}: {exception}")
+        logger.debug("Play status error for %s: %s", self.device.identifier, exception)
 
 
 @device
-@dataclass
+@dataclass(slots=True)
 class AppleTV:
     identifier: str
     device_id: str
@@ -56,29 +71,57 @@ class AppleTV:
     _atv: Optional[pyatv.interface.AppleTV] = field(default=None, repr=False)
     _connected: bool = field(default=False, repr=False)
     _listener: Optional[DeviceListener] = field(default=None, repr=False)
+    _config: Optional[pyatv.interface.BaseConfig] = field(
+        default=None, repr=False, compare=False
+    )
+    _connect_lock: Optional[asyncio.Lock] = field(
+        default=None, repr=False, compare=False
+    )
+    _playstatus_cache: Optional[tuple[float, dict | None]] = field(
+        default=None, repr=False, compare=False
+    )
+    _playstatus_inflight: Optional[asyncio.Future] = field(
+        default=None, repr=False, compare=False
+    )
 
     async def connect(self) -> None:
         """Connect to the Apple TV device."""
         if self._connected:
-            logger.debug(f"Already connected to {self.identifier}")
+            logger.debug("Already connected to %s", self.identifier)
             return
 
-        loop = asyncio.get_event_loop()
-        r = await pyatv.scan(identifier=self.device_id, loop=loop)
-        if not r:
-            raise RuntimeError(
-                f"Apple TV '{self.identifier}' not found (id: {self.device_id})"
-            )
-
-        config = r[0]
-        config.set_credentials(pyatv.Protocol.Companion, self.credentials)
-
-        self._atv = await pyatv.connect(config, loop=loop)
-        self._listener = DeviceListener(self)
-        self._atv.listener = self._listener
-        self._atv.push_updater.listener = self._listener
-        self._atv.push_updater.start()
-        logger.info(f"Connected to {self.identifier}")
+        # Serialize connection attempts so concurrent sensor reads after a
+        # disconnect only trigger a single scan/connect. The lock is created on
+        # first use so it is bound to the running loop.
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._atv is not None:
+                logger.debug("Already connected to %s", self.identifier)
+                return
+
+            loop = asyncio.get_running_loop()
+            if self._config is None:
+                r = await pyatv.scan(identifier=self.device_id, loop=loop)
+                if not r:
+                    raise RuntimeError(
+                        f"Apple TV '{self.identifier}' not found (id: {self.device_id})"
+                    )
+                self._config = r[0]
+                self._config.set_credentials(pyatv.Protocol.Companion, self.credentials)
+
+            try:
+                self._atv = await pyatv.connect(self._config, loop=loop)
+            except Exception:
+                # Scan again on next attempt in case the device has moved
+                self._config = None
+                raise
+
+            self._listener = DeviceListener(self)
+            self._atv.listener = self._listener
+            self._atv.push_updater.listener = self._listener
+            self._atv.push_updater.start()
+            logger.info(f"Connected to {self.identifier}")
 
     async def disconnect(self) -> None:
         """Disconnect from the Apple TV device."""
@@ -108,16 +151,47 @@ class AppleTV:
         if not self._atv:
             await self.connect()
 
+        # Return recently fetched status, or join a fetch already in progress
+        cached = self._playstatus_cache
+        if cached is not None and time.monotonic() - cached[0] < PLAYSTATUS_TTL:
+            return cached[1]
+        if self._playstatus_inflight is not None:
+            return await asyncio.shield(self._playstatus_inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._playstatus_inflight = future
+        try:
+            result = await self._fetch_playstatus()
+        except BaseException as e:
+            # Hand joined callers a real error, also when the fetch is cancelled
+            # (e.g. by the sensor timeout)
+            if isinstance(e, asyncio.CancelledError):
+                future.set_exception(
+                    TimeoutError(f"Play status fetch for {self.identifier} cancelled")
+                )
+            else:
+                future.set_exception(e)
+            future.exception()  # Mark exception as retrieved
+            raise
+        else:
+            self._playstatus_cache = (time.monotonic(), result)
+            future.set_result(result)
+            return result
+        finally:
+            self._playstatus_inflight = None
+
+    async def _fetch_playstatus(self) -> dict | None:
+        """Fetch the current play status from the device."""
         try:
             status = await self._atv.metadata.playing()
             return {
                 "title": status.title,
                 "artist": status.artist,
                 "album": status.album,
-                "media_type": str(status.media_type),
-                "device_state": str(status.device_state),
-                "repeat": str(status.repeat),
-                "shuffle": str(status.shuffle),
+                "media_type": _enum_str(_MEDIA_TYPE_STR, status.media_type),
+                "device_state": _enum_str(_DEVICE_STATE_STR, status.device_state),
+                "repeat": _enum_str(_REPEAT_STR, status.repeat),
+                "shuffle": _enum_str(_SHUFFLE_STR, status.shuffle),
                 "position": status.position,
                 "total_time": status.total_time,
             }
@@ -1,11 +1,14 @@
 import logging
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, IntEnum
+from typing import Optional
 
 import httpx
+import orjson
 
 from comando.controller import device, sensor
+from comando.helpers.http import create_client
 
 COMMAND_TPL: str = "https://{host}/httpapi.asp?command={cmd}"
 POLL_INTERVAL: float = 1.0
@@ -33,19 +36,30 @@ class PlayerStatus(Enum):
     PAUSED = "pause"
 
 
+# Reverse lookups by value, avoiding Enum.__call__ overhead
+_MODE_BY_VALUE: dict[int, PlayerMode] = {m.value: m for m in PlayerMode}
+_STATUS_BY_VALUE: dict[str, PlayerStatus] = {m.value: m for m in PlayerStatus}
+
+
 @device(ttl=0.5)
-@dataclass
+@dataclass(slots=True)
 class WiiM:
     identifier: str
     host: str
+    _client: Optional[httpx.AsyncClient] = field(
+        default=None, repr=False, compare=False
+    )
 
     async def connect(self) -> None:
         """Connect to the WiiM device."""
+        # The HTTP client is created on the first request
         pass
 
     async def disconnect(self) -> None:
         """Disconnect from the WiiM device."""
-        pass
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _make_request(self, command: str) -> dict:
         """Make an HTTP request to the WiiM device.
@@ -62,18 +76,13 @@ class WiiM:
             ValueError: If the response is not valid JSON
         """
         url = COMMAND_TPL.format(host=self.host, cmd=command)
-        # Define headers to prevent caching
-        headers = {
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        }
+        if self._client is None:
+            self._client = create_client()
         try:
-            async with httpx.AsyncClient(verify=False) as client:
-                logger.debug("Making request to %s", url)
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            logger.debug("Making request to %s", url)
+            response = await self._client.get(url)
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error("HTTP error while making request: %s", e)
             raise
@@ -122,7 +131,9 @@ class WiiM:
         """
         status = await self._player_status
         try:
-            return PlayerMode(int(status.get("mode", -1)))
+            return _MODE_BY_VALUE.get(
+                int(status.get("mode", -1)), PlayerMode.UNRECOGNIZED
+            )
         except (ValueError, KeyError):
             return PlayerMode.UNRECOGNIZED
 
@@ -143,10 +154,7 @@ class WiiM:
             ValueError: If the response is not valid JSON
         """
         status = await self._player_status
-        try:
-            return PlayerStatus(status.get("status", "stop"))
-        except ValueError:
-            return PlayerStatus.STOPPED
+        return _STATUS_BY_VALUE.get(status.get("status", "stop"), PlayerStatus.STOPPED)
 
     @sensor
     async def playlist_count(self) -> int:
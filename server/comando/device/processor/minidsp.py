@@ -1,15 +1,18 @@
 import logging
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional
 
 import httpx
+import orjson
 
 from comando.controller import device, sensor
+from comando.helpers.http import create_client
 
 COMMAND_TPL: str = "http://{host}:{port}/devices/{cmd}"
 POLL_INTERVAL: float = 1.0
+MASTER_FIELDS: tuple[str, ...] = ("volume", "mute", "dirac", "preset", "source")
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +23,21 @@ class Source(Enum):
     SPDIF = "SPDIF"
 
 
+# Reverse lookup by value, avoiding Enum.__call__ overhead
+_SOURCE_BY_VALUE: dict[str, Source] = {m.value: m for m in Source}
+
+
+def _parse_source(source_str: str) -> Source | str:
+    """Return the Source for a source string, or the string itself if unknown."""
+    source = _SOURCE_BY_VALUE.get(source_str)
+    if source is None:
+        logger.warning("Unknown source value received: %s", source_str)
+        return source_str
+    return source
+
+
 @device(ttl=0.5)
-@dataclass
+@dataclass(slots=True)
 class MiniDSP:
     identifier: str
     host: str
@@ -29,6 +45,12 @@ class MiniDSP:
     serial: int
     _device_index: Optional[int] = None
     _device_status: Dict[str, Any] = None
+    _master_status: Optional[Dict[str, Any]] = field(
+        default=None, repr=False, compare=False
+    )
+    _client: Optional[httpx.AsyncClient] = field(
+        default=None, repr=False, compare=False
+    )
 
     async def _request(
         self,
@@ -52,19 +74,14 @@ class MiniDSP:
             ValueError: If the response is not valid JSON
         """
         url = COMMAND_TPL.format(host=self.host, port=self.port, cmd=command or "")
-
-        headers = {
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        }
+        if self._client is None:
+            self._client = create_client()
 
         try:
-            async with httpx.AsyncClient(verify=False) as client:
-                logger.debug("Making %s request to %s", method, url)
-                response = await client.request(method, url, headers=headers, json=json)
-                response.raise_for_status()
-                return response.json() if method == "GET" else {}
+            logger.debug("Making %s request to %s", method, url)
+            response = await self._client.request(method, url, json=json)
+            response.raise_for_status()
+            return orjson.loads(response.content) if method == "GET" else {}
         except httpx.HTTPStatusError as e:
             logger.error("HTTP error while making request: %s", e)
             raise
@@ -116,6 +133,10 @@ class MiniDSP:
     async def disconnect(self) -> None:
         """Disconnect from the MiniDSP device."""
         self._device_index = None
+        self._master_status = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     @property
     async def _status(self) -> Dict[str, Any]:
@@ -127,61 +148,69 @@ class MiniDSP:
         return self._device_status
 
     @sensor(poll_interval=POLL_INTERVAL)
+    async def master_status(self) -> Dict[str, Any]:
+        """Current master status (volume, mute, dirac, preset and source).
+
+        Raises a <field>_changed event for each master field that changed, so
+        the individual fields are kept up to date by a single polled request."""
+        status = await self._status
+        master = status["master"]
+
+        previous = self._master_status or {}
+        self._master_status = master
+        for key in MASTER_FIELDS:
+            if key in master and (key not in previous or previous[key] != master[key]):
+                value = _parse_source(master[key]) if key == "source" else master[key]
+                self.raise_event_sync(f"{key}_changed", value)
+
+        return master
+
+    @property
     async def volume(self) -> float:
         """Current master volume in dB."""
-        status = await self._status
-        return status["master"]["volume"]
+        return (await self.master_status)["volume"]
 
     @volume.setter
     async def volume(self, value: float) -> None:
         """Current master volume in dB."""
         await self._apply_config({"master_status": {"volume": value}})
 
-    @sensor(poll_interval=POLL_INTERVAL)
+    @property
     async def mute(self) -> bool:
         """Current master mute state."""
-        status = await self._status
-        return status["master"]["mute"]
+        return (await self.master_status)["mute"]
 
     @mute.setter
     async def mute(self, value: bool) -> None:
         """Current master mute state."""
         await self._apply_config({"master_status": {"mute": value}})
 
-    @sensor(poll_interval=POLL_INTERVAL)
+    @property
     async def dirac(self) -> bool:
         """Current master Dirac state."""
-        status = await self._status
-        return status["master"]["dirac"]
+        return (await self.master_status)["dirac"]
 
     @dirac.setter
     async def dirac(self, value: bool) -> None:
         """Current master Dirac state."""
         await self._apply_config({"master_status": {"dirac": value}})
 
-    @sensor(poll_interval=POLL_INTERVAL)
+    @property
     async def preset(self) -> int:
         """Current active preset number."""
-        status = await self._status
-        return status["master"]["preset"]
+        return (await self.master_status)["preset"]
 
     @preset.setter
     async def preset(self, value: int) -> None:
         """Current active preset number."""
         await self._apply_config({"master_status": {"preset": value}})
 
-    @sensor(poll_interval=POLL_INTERVAL)
+    @property
     async def source(self) -> Source | str:
         """Current active input source.
 
         Returns Source enum value if known, or raw string if unknown."""
-        status = await self._status
-        source_str = status["master"]["source"]
-        try:
-            return Source(source_str)
-        except ValueError:
-            logger.warning("Unknown source value received: %s", source_str)
-            return source_str
+        return _parse_source((await self.master_status)["source"])
 
     @source.setter
     async def source(self, value: Source) -> None:
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
-import socket
+import time
 
 from comando.controller import DeviceProtocol, device, sensor
 from comando.helpers.telnet import Telnet
 
 logger = logging.getLogger(__name__)
 
+# Commands for all sensors, refreshed together in a single round trip
+REFRESH_COMMANDS = ["get inseltx0", "get inseltx1", "get cec", "get osd"]
+
 """
 TODO:
 Timeout should be applied correctly considering both device-wide and
@@ -24,62 +27,103 @@ class Vertex2(DeviceProtocol):
     def __init__(self, identifier: str, host: str, port: int):
         self.identifier = identifier
         self._connection = Telnet(
-            host, port, timeout=self._device_config["timeout"], thread_safe=True
+            host, port, timeout=self._effective_timeout, thread_safe=True
         )
+        # Responses to query commands with the time they were received, keyed by
+        # command
+        self._cache: dict[str, tuple[float, str]] = {}
+        self._refresh_task: asyncio.Task | None = None
 
     async def disconnect(self) -> None:
-        pass
+        await self._connection.disconnect()
+        self._cache.clear()
 
     async def send_command(self, command: str) -> str:
+        return (await self.send_commands([command]))[0]
+
+    async def send_commands(self, commands: list[str]) -> list[str]:
         try:
-            logger.debug(f"Sending command: {command}")
+            logger.debug("Sending commands: %s", commands)
             async with self._connection.session():
-                r = self._connection.send_message(command)
-                logger.debug(f"Received response: {r}")
+                r = await self._connection.send_batch(commands)
+                logger.debug("Received responses: %s", r)
                 return r
-        except socket.timeout as e:
-            logger.error(f"Timeout while communicating with Vertex2: {e}")
-            raise ConnectionError(
-                f"Timeout while communicating with Vertex2: {e}"
-            ) from e
         except Exception as e:
             logger.error(f"Failed to communicate with Vertex2: {e}")
             raise ConnectionError(f"Failed to communicate with Vertex2: {e}") from e
 
-    @sensor
-    async def input_tx0(self) -> int:
-        r = await self.send_command("get inseltx0")
-        match = re.match(r"inseltx0\s+(\d+)", r.strip())
-        if not match:
+    async def _refresh_all(self) -> None:
+        """
+        Fetch the responses for all sensors in a single round trip. Concurrent
+        callers share the same in-flight refresh, so sensors read together only
+        take the connection lock once.
+        """
+        task = self._refresh_task
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_all())
+            task.add_done_callback(self._refresh_done)
+            self._refresh_task = task
+        await asyncio.shield(task)
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        self._refresh_task = None
+        if not task.cancelled():
+            task.exception()  # Mark exception as retrieved
+
+    async def _fetch_all(self) -> None:
+        responses = await self.send_commands(REFRESH_COMMANDS)
+        now = time.monotonic()
+        for command, r in zip(REFRESH_COMMANDS, responses):
+            self._cache[command] = (now, r)
+
+    async def _get_response(self, command: str) -> str:
+        """
+        Return the response to a query command, reusing a cached response that is
+        younger than the device TTL.
+        """
+        entry = self._cache.get(command)
+        if entry is not None and time.monotonic() - entry[0] < self._effective_ttl:
+            return entry[1]
+
+        if command in REFRESH_COMMANDS:
+            # Populate the cache for all sensors with the same round trip
+            await self._refresh_all()
+            return self._cache[command][1]
+
+        r = await self.send_command(command)
+        self._cache[command] = (time.monotonic(), r)
+        return r
+
+    async def _get_int(self, command: str, prefix: str) -> int:
+        """Query a value from a response of the form "<prefix> <n>"."""
+        r = await self._get_response(command)
+        parts = r.split()
+        if len(parts) < 2 or parts[0] != prefix or not parts[1].isdigit():
             logger.error(f"Failed to parse response: '{r}'")
             raise ValueError(f"Unexpected response format: {r}")
-        value = int(match.group(1))
-        return value
+        return int(parts[1])
 
-    @sensor
-    async def input_tx1(self) -> int:
-        r = await self.send_command("get inseltx1")
-        match = re.match(r"inseltx1\s+(\d+)", r.strip())
-        if not match:
+    async def _get_bool(self, command: str, prefix: str) -> bool:
+        """Query a value from a response of the form "<prefix> on|off"."""
+        r = await self._get_response(command)
+        parts = r.split()
+        if len(parts) < 2 or parts[0] != prefix or parts[1] not in ("on", "off"):
             logger.error(f"Failed to parse response: '{r}'")
             raise ValueError(f"Unexpected response format: {r}")
-        value = int(match.group(1))
-        return value
+        return parts[1] == "on"
+
+    @sensor
+    async def input_tx0(self) -> int:
+        return await self._get_int("get inseltx0", "inseltx0")
+
+    @sensor
+    async def input_tx1(self) -> int:
+        return await self._get_int("get inseltx1", "inseltx1")
 
     @sensor
     async def cec(self) -> bool:
-        r = await self.send_command("get cec")
-        match = re.match(r"cec\s+(on|off)", r.strip())
-        if not match:
-            logger.error(f"Failed to parse response: '{r}'")
-            raise ValueError(f"Unexpected response format: {r}")
-        return match.group(1) == "on"
+        return await self._get_bool("get cec", "cec")
 
     @sensor
     async def osd(self) -> bool:
-        r = await self.send_command("get osd")
-        match = re.match(r"osd\s+(on|off)", r.strip())
-        if not match:
-            logger.error(f"Failed to parse response: '{r}'")
-            raise ValueError(f"Unexpected response format: {r}")
-        return match.group(1) == "on"
+        return await self._get_bool("get osd", "osd")
@@ -0,0 +1,20 @@
+"""
+Helpers for devices controlled over HTTP.
+"""
+
+import httpx
+
+NO_CACHE_HEADERS: dict[str, str] = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
+def create_client() -> httpx.AsyncClient:
+    """Create an HTTP client that keeps the connection to the device alive."""
+    return httpx.AsyncClient(
+        verify=False,
+        headers=NO_CACHE_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=1),
+    )
@@ -1,27 +1,120 @@
-import socket
-import time
+import asyncio
+
+from contextlib import suppress
+from typing import Optional
+
+PORT: int = 4999
+TIMEOUT: float = 3
+# How long to keep collecting further replies after the first one
+REPLY_IDLE_TIMEOUT: float = 0.1
+# How long to wait for data when discarding stale replies before a send
+DRAIN_TIMEOUT: float = 0.01
 
 
 class ITach:
+    """
+    Sends commands to a serial port on a Global Caché iTach over TCP. The
+    connection is opened on first use and reused for subsequent sends, use
+    close() or the instance as an async context manager to release it.
+    """
+
     def __init__(self, ip_address: str):
         self.ip_address = ip_address
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
 
-    def send(
+    async def __aenter__(self) -> "ITach":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _ensure_connected(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Connect to the iTach if not already connected and return the streams."""
+        if self._writer is None:
+            # asyncio disables Nagle on TCP transports, so the tiny commands are
+            # sent without waiting to coalesce
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.ip_address, PORT), timeout=TIMEOUT
+            )
+            try:
+                writer.write(b"CRT\r")
+                await writer.drain()
+            except OSError:
+                writer.close()
+                raise
+            self._reader, self._writer = reader, writer
+        return self._reader, self._writer
+
+    async def close(self) -> None:
+        """Closes the connection if it is open."""
+        writer = self._writer
+        if writer is not None:
+            self._reader = self._writer = None
+            writer.close()
+            with suppress(OSError):
+                await writer.wait_closed()
+
+    async def send(
         self,
         command: str | list[str],
         interval_seconds: int = 0.1,
-    ) -> None | bytes:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(3)
-            s.connect((self.ip_address, 4999))
-            s.send(b"CRT\r")
-            if not isinstance(command, list):
-                command = [command]
+    ) -> str:
+        try:
+            try:
+                return await self._send(command, interval_seconds)
+            except (BrokenPipeError, ConnectionResetError):
+                # The connection was dropped by the iTach, reconnect and retry once
+                await self.close()
+                return await self._send(command, interval_seconds)
+        except OSError:
+            # Do not reuse a connection in an unknown state
+            await self.close()
+            raise
+
+    async def _send(self, command: str | list[str], interval_seconds: int) -> str:
+        reader, writer = await self._ensure_connected()
+        await self._discard_buffered(reader)
+        if not isinstance(command, list):
+            command = [command]
+        if interval_seconds:
             for cmd in command:
-                if interval_seconds:
-                    time.sleep(interval_seconds)
-                s.send(cmd.encode("ascii"))
-                s.send(b"\r")
+                await asyncio.sleep(interval_seconds)
+                writer.write(cmd.encode("ascii") + b"\r")
+                await writer.drain()
+        else:
+            # No pacing required, send all commands in a single write
+            writer.write(b"".join(cmd.encode("ascii") + b"\r" for cmd in command))
+            await writer.drain()
+
+        # Not every command is answered (e.g. a receiver ignores commands while
+        # waking up), so wait for the first reply and then collect any further
+        # replies until the connection goes idle
+        replies = [await self._read_reply(reader, TIMEOUT)]
+        while True:
+            try:
+                replies.append(await self._read_reply(reader, REPLY_IDLE_TIMEOUT))
+            except TimeoutError:
+                break
+        return "\r\n".join(replies)
+
+    async def _discard_buffered(self, reader: asyncio.StreamReader) -> None:
+        """Discard late or unsolicited replies left over on the connection."""
+        while True:
+            try:
+                data = await asyncio.wait_for(reader.read(1024), timeout=DRAIN_TIMEOUT)
+            except TimeoutError:
+                return
+            if not data:
+                raise ConnectionResetError("Connection closed by iTach")
 
-            data = s.recv(1024)
-            return data.rstrip().decode("ascii")
+    async def _read_reply(self, reader: asyncio.StreamReader, timeout: float) -> str:
+        try:
+            data = await asyncio.wait_for(reader.readuntil(b"\r"), timeout=timeout)
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionResetError("Connection closed by iTach") from e
+        # Replies may be terminated by CRLF, the LF is left over from the
+        # previous reply
+        return data.strip().decode("ascii")
@@ -2,101 +2,183 @@ import asyncio
 import logging
 import socket
 
-from contextlib import asynccontextmanager
-from dataclasses import KW_ONLY, dataclass, field
+from contextlib import asynccontextmanager, suppress
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-class ConnectionState:
-    """Helper class to store mutable state for frozen TelnetConnection."""
-
-    def __init__(self, thread_safe: bool):
-        self.socket: Optional[socket.socket] = None
-        self.lock: Optional[asyncio.Lock] = asyncio.Lock() if thread_safe else None
+class Telnet:
+    """Async telnet client that keeps a single connection open between sessions."""
+
+    __slots__ = ("host", "lock", "port", "reader", "thread_safe", "timeout", "writer")
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        timeout: Optional[int] = None,
+        thread_safe: bool = False,
+    ):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.thread_safe = thread_safe
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        # Created on first use so it is bound to the loop running the sessions
+        self.lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Telnet(host={self.host!r}, port={self.port!r}, "
+            f"timeout={self.timeout!r}, thread_safe={self.thread_safe!r})"
+        )
 
     @property
     def is_connected(self) -> bool:
-        return self.socket is not None
+        return self.writer is not None
 
+    async def __aenter__(self) -> "Telnet":
+        await self.connect()
+        return self
 
-@dataclass(frozen=True)
-class Telnet:
-    host: str
-    port: int
-    _: KW_ONLY
-    timeout: int = None
-    thread_safe: bool = False
-    _state: ConnectionState = field(init=False, repr=False)
-
-    def __post_init__(self):
-        object.__setattr__(self, "_state", ConnectionState(self.thread_safe))
+    async def __aexit__(self, *exc_info) -> None:
+        await self.disconnect()
 
     @asynccontextmanager
     async def session(self):
         """
-        Creates an async context manager for a single connection session.
+        Creates an async context manager for a connection session.
         If thread_safe is True, waits for the lock to be available.
+
+        The connection is kept open between sessions and is only established
+        when not already connected. If the session fails, the connection is
+        closed so that the next session reconnects.
         """
 
-        if self._state.lock:
-            await self._state.lock.acquire()
+        if self.thread_safe and self.lock is None:
+            self.lock = asyncio.Lock()
+        if self.lock:
+            await self.lock.acquire()
 
         try:
-            self.connect()
+            if not self.is_connected:
+                await self.connect()
             yield self
+        except BaseException:
+            await self.disconnect()
+            raise
         finally:
-            self.disconnect()
-            if self._state.lock:
-                self._state.lock.release()
+            if self.lock:
+                self.lock.release()
 
-    def connect(self) -> None:
+    async def connect(self) -> None:
         """
         Establishes a telnet connection to the specified host and port.
 
         Raises:
             RuntimeError: If already connected
+            ConnectionError: If the connection is not established within the timeout
         """
-        if self._state.is_connected:
+        if self.is_connected:
             raise RuntimeError("Already connected")
 
-        self._state.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        if self.timeout:
-            self._state.socket.settimeout(self.timeout)
-        self._state.socket.connect((self.host, self.port))
-
-    def disconnect(self) -> None:
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout=self.timeout
+            )
+        except TimeoutError as e:
+            raise ConnectionError(
+                f"Timed out connecting to telnet server {self.host}:{self.port}"
+            ) from e
+        # asyncio already disables Nagle on TCP transports, enable keepalive so a
+        # dead peer is detected on the otherwise idle persistent connection
+        sock = self.writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    async def disconnect(self) -> None:
         """Closes the telnet connection if it exists."""
-        if self._state.socket is not None:
-            self._state.socket.close()
-            self._state.socket = None
-
-    def send_message(self, message: str, buffer_size: int = 4096) -> str:
+        writer = self.writer
+        if writer is not None:
+            self.reader = self.writer = None
+            writer.close()
+            with suppress(OSError):
+                await writer.wait_closed()
+
+    async def send_message(self, message: str) -> str:
         """
         Sends a message through the telnet connection and returns the response.
 
         Args:
             message: The message to send
-            buffer_size: Size of the receiving buffer (default: 1024)
 
         Returns:
             The response received from the server
 
         Raises:
-            ConnectionError: If not connected when trying to send a message
+            ConnectionError: If not connected or no response is received
         """
 
-        if not self._state.is_connected:
+        if not self.is_connected:
             raise ConnectionError("Not connected to telnet server")
 
-        self._state.socket.send(message.encode("ascii") + b"\r\n")
+        self.writer.write(message.encode("ascii") + b"\r\n")
+        await self.writer.drain()
         logger.debug("message sent to socket, awaiting response...")
-        r = self._state.socket.recv(buffer_size)
-        logger.debug(f"response recieved: {r}")
-        return r.decode("ascii").strip()
+        r = await self._read_line()
+        logger.debug("response recieved: %s", r)
+        return r
+
+    async def send_batch(self, messages: list[str]) -> list[str]:
+        """
+        Sends several messages in a single write and returns their responses.
 
-    def __del__(self):
-        """Ensures the connection is closed when the object is destroyed."""
+        Args:
+            messages: The messages to send, each is terminated by CRLF
+
+        Returns:
+            The responses received from the server, one per message
 
-        self.disconnect()
+        Raises:
+            ConnectionError: If not connected or a response is not received
+        """
+
+        if not self.is_connected:
+            raise ConnectionError("Not connected to telnet server")
+
+        payload = "".join(f"{message}\r\n" for message in messages)
+        self.writer.write(payload.encode("ascii"))
+        await self.writer.drain()
+        logger.debug("batch of %d messages sent to socket", len(messages))
+
+        # Read exactly one line per message, anything after that is left in the
+        # stream instead of being discarded
+        r = [await self._read_line() for _ in messages]
+        logger.debug("responses recieved: %s", r)
+        return r
+
+    async def _read_line(self) -> str:
+        """
+        Reads a single CRLF-terminated response line.
+
+        Raises:
+            ConnectionError: If no line is received within the timeout, the server
+                closes the connection mid-line or the line exceeds the stream
+                buffer limit
+        """
+        try:
+            line = await asyncio.wait_for(
+                self.reader.readuntil(b"\r\n"), timeout=self.timeout
+            )
+        except TimeoutError as e:
+            raise ConnectionError("Timed out waiting for telnet server") from e
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionError("Connection closed by telnet server") from e
+        except asyncio.LimitOverrunError as e:
+            raise ConnectionError("Response from telnet server too long") from e
+        # StreamReader already reuses its internal buffer between reads, decode
+        # through a memoryview so dropping the CRLF does not copy the line again
+        return str(memoryview(line)[:-2], "ascii").strip()